@@ -0,0 +1,521 @@
+import base64
+import functools
+import http.client
+import io
+import json
+import os
+import re
+import shutil
+import stat
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+import urllib.request
+from urllib.parse import unquote, urlparse
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None
+
+GRAPHQL_BATCH_SIZE = 100
+GH_CACHE_TTL = 24 * 60 * 60
+GITHUB_API_HOST = "api.github.com"
+GITHUB_API_TIMEOUT = 30
+
+_SLUG_SEPARATORS = str.maketrans({ch: "-" for ch in " _."})
+_SLUG_DROP = re.compile(r"[^\w-]")
+_SLUG_DASHES = re.compile(r"-{2,}")
+_TAGS_KEY = re.compile(r"""^\s*(?:tags|"tags"|'tags')\s*=""")
+_TABLE_HEADER = re.compile(r"^\s*\[")
+_QUOTED_STRING = re.compile(r'"([^"]*)"')
+# Quoted text, masked out when looking for brackets and comments.
+_TOML_STRING = re.compile(r'"[^"]*"|\'[^\']*\'')
+
+
+def build_items(home: Path) -> Iterator[Path]:
+    yield from static_items(home)
+    for folder in index_folders(home):
+        if not folder.is_dir():
+            continue
+        yield folder
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    yield Path(entry.path)
+
+
+def unique_paths(paths: Iterable[Path]) -> Iterator[Path]:
+    # Resolving also folds symlinked layouts (e.g. /opt/homebrew) together.
+    seen: set[str] = set()
+    for path in paths:
+        resolved = os.path.realpath(path)
+        if resolved in seen:
+            continue
+        seen.add(resolved)
+        yield Path(resolved)
+
+
+def index_folders(home: Path) -> list[Path]:
+    return [home / "Github", home / "Desktop"]
+
+
+def static_items(home: Path) -> list[Path]:
+    return [
+        home / "Desktop",
+        Path("/opt/homebrew"),
+        home / "Downloads",
+        home
+        / "Library"
+        / "Application Support"
+        / "ModrinthApp"
+        / "profiles"
+        / "Create-Prepare-to-Dye",
+        home
+        / "Library"
+        / "Application Support"
+        / "ModrinthApp"
+        / "profiles"
+        / "Create ptd 2",
+    ]
+
+
+def git_root(path: Path) -> Path | None:
+    root = _git_root(os.fspath(path))
+    return Path(root) if root is not None else None
+
+
+@functools.lru_cache(maxsize=None)
+def _git_root(path: str) -> str | None:
+    # One stat per directory; the upward walk is cached on the parent so
+    # sibling non-repo folders (e.g. under ~/Downloads) share it.
+    try:
+        marker = os.stat(os.path.join(path, ".git"))
+    except OSError:
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        return _git_root(parent)
+    if stat.S_ISDIR(marker.st_mode):
+        return path
+    # Worktrees and submodules use a gitfile; git stops at a broken one.
+    return path if git_dir(Path(path)) is not None else None
+
+
+def git_dir(repo_root: Path) -> Path | None:
+    marker = repo_root / ".git"
+    if marker.is_dir():
+        return marker
+    try:
+        contents = marker.read_text()
+    except OSError:
+        return None
+    if not contents.startswith("gitdir:"):
+        return None
+    target = repo_root / contents[len("gitdir:") :].strip()
+    return target if target.is_dir() else None
+
+
+def git_common_dir(repo_root: Path) -> Path | None:
+    gitdir = git_dir(repo_root)
+    if gitdir is None:
+        return None
+    try:
+        common = (gitdir / "commondir").read_text().strip()
+    except OSError:
+        return gitdir
+    return gitdir / common
+
+
+class GhClient:
+    """GitHub GraphQL access shared across one run; repo lookups are kept."""
+
+    def __init__(self, fields: str, cache_path: Path | None = None) -> None:
+        self.fields = fields
+        self.repos: dict[tuple[str, str], dict | None] = {}
+        self.cache_path = cache_path
+        self.cache = load_gh_cache(cache_path)
+        self.cache_dirty = False
+        self.token: str | None = None
+        self.connection: http.client.HTTPSConnection | None = None
+
+    def repo_info(self, roots: list[Path]) -> dict[Path, dict]:
+        targets: dict[Path, tuple[str, str]] = {}
+        for root in roots:
+            repo = github_repo(origin_url(root))
+            if repo is not None:
+                targets[root] = repo
+
+        self.fetch(list(targets.values()))
+        infos: dict[Path, dict] = {}
+        for root, repo in targets.items():
+            info = self.repos.get(repo)
+            if info is not None:
+                infos[root] = info
+        return infos
+
+    def fetch(self, repos: list[tuple[str, str]]) -> None:
+        now = time.time()
+        pending = []
+        for repo in dict.fromkeys(repos):
+            if repo in self.repos:
+                continue
+            entry = self.cache.get("/".join(repo))
+            if (
+                entry is not None
+                and entry.get("fields") == self.fields
+                and now - entry["fetched"] < GH_CACHE_TTL
+            ):
+                self.repos[repo] = entry.get("info")
+                continue
+            pending.append(repo)
+
+        # One keep-alive connection serves every batch, one request at a time.
+        for start in range(0, len(pending), GRAPHQL_BATCH_SIZE):
+            batch = pending[start : start + GRAPHQL_BATCH_SIZE]
+            data = self.graphql(self.build_query(batch))
+            if data is None:
+                continue
+            for i, repo in enumerate(batch):
+                node = data.get(f"r{i}")
+                info = node if isinstance(node, dict) else None
+                self.repos[repo] = info
+                self.cache["/".join(repo)] = {
+                    "fields": self.fields,
+                    "info": info,
+                    "fetched": now,
+                }
+                self.cache_dirty = True
+
+    def save_cache(self) -> None:
+        if self.cache_path is None or not self.cache_dirty:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write(self.cache_path, json.dumps(self.cache, sort_keys=True))
+        self.cache_dirty = False
+
+    def build_query(self, repos: list[tuple[str, str]]) -> str:
+        parts = []
+        for i, (owner, name) in enumerate(repos):
+            args = f"owner: {json.dumps(owner)}, name: {json.dumps(name)}"
+            parts.append(f"r{i}: repository({args}) {{ {self.fields} }}")
+        return "query { " + " ".join(parts) + " }"
+
+    def graphql(self, query: str) -> dict | None:
+        # A missing or inaccessible repo comes back as null next to an error
+        # entry, without failing the rest of the batch. None means the request
+        # itself failed; nothing of it is cached.
+        raw = self.post(json.dumps({"query": query}).encode())
+        if raw is None:
+            return None
+        try:
+            payload = json.loads(raw)
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(payload, dict):
+            return None
+        data = payload.get("data")
+        return data if isinstance(data, dict) else None
+
+    def post(self, body: bytes) -> bytes | None:
+        if self.token is None:
+            self.token = gh_token() or ""
+        if not self.token:
+            return None
+        headers = {
+            "Authorization": f"bearer {self.token}",
+            "Content-Type": "application/json",
+            "User-Agent": "navgator-scripts",
+        }
+        # Retry once on a fresh connection if the server dropped the idle one.
+        for _ in range(2):
+            if self.connection is None:
+                self.connection = github_connection()
+            try:
+                self.connection.request("POST", "/graphql", body=body, headers=headers)
+                return self.connection.getresponse().read()
+            except (OSError, http.client.HTTPException):
+                self.close()
+        return None
+
+    def close(self) -> None:
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+def github_connection() -> http.client.HTTPSConnection:
+    # gh honors HTTPS_PROXY/NO_PROXY; tunnel through the proxy the same way.
+    proxy = urllib.request.getproxies().get("https")
+    if not proxy or urllib.request.proxy_bypass(GITHUB_API_HOST):
+        return http.client.HTTPSConnection(GITHUB_API_HOST, timeout=GITHUB_API_TIMEOUT)
+    parsed = urlparse(proxy if "://" in proxy else f"http://{proxy}")
+    connection = http.client.HTTPSConnection(
+        parsed.hostname, parsed.port or 80, timeout=GITHUB_API_TIMEOUT
+    )
+    headers = {}
+    if parsed.username:
+        credentials = f"{unquote(parsed.username)}:{unquote(parsed.password or '')}"
+        token = base64.b64encode(credentials.encode()).decode()
+        headers["Proxy-Authorization"] = f"Basic {token}"
+    connection.set_tunnel(GITHUB_API_HOST, 443, headers)
+    return connection
+
+
+def gh_token() -> str | None:
+    token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if token:
+        return token
+    try:
+        result = subprocess.run(
+            ["gh", "auth", "token"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+def gh_cache_path() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    base = Path(cache_home) if cache_home else Path.home() / ".cache"
+    return base / "navgator" / "gh_meta.json"
+
+
+def load_gh_cache(cache_path: Path | None) -> dict[str, dict]:
+    if cache_path is None:
+        return {}
+    try:
+        data = json.loads(cache_path.read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    # Malformed entries are dropped, which makes those repos look stale.
+    return {key: entry for key, entry in data.items() if _valid_gh_entry(entry)}
+
+
+def _valid_gh_entry(entry: object) -> bool:
+    if not isinstance(entry, dict):
+        return False
+    fetched = entry.get("fetched")
+    info = entry.get("info")
+    return (
+        isinstance(fetched, (int, float))
+        and not isinstance(fetched, bool)
+        and isinstance(entry.get("fields"), str)
+        and (info is None or isinstance(info, dict))
+    )
+
+
+def origin_url(repo_root: Path) -> str | None:
+    common_dir = git_common_dir(repo_root)
+    if common_dir is None:
+        return None
+    try:
+        contents = (common_dir / "config").read_text()
+    except OSError:
+        return None
+    in_origin = False
+    for line in contents.splitlines():
+        cleaned = line.strip()
+        if cleaned.startswith("["):
+            in_origin = cleaned == '[remote "origin"]'
+            continue
+        if not in_origin or "=" not in cleaned:
+            continue
+        key, value = cleaned.split("=", 1)
+        if key.strip() == "url":
+            return value.strip()
+    return None
+
+
+def github_repo(url: str | None) -> tuple[str, str] | None:
+    if not url:
+        return None
+    if "://" in url:
+        parsed = urlparse(url)
+        host = parsed.hostname or ""
+        path = parsed.path
+    elif ":" in url:
+        host, path = url.split(":", 1)
+        host = host.rsplit("@", 1)[-1].lower()
+    else:
+        return None
+    if host != "github.com":
+        return None
+    parts = [part for part in path.split("/") if part]
+    if len(parts) != 2:
+        return None
+    owner, name = parts[0], parts[1].removesuffix(".git")
+    if not owner or not name:
+        return None
+    return owner, name
+
+
+def read_config(config_path: Path) -> tuple[str, list[str]]:
+    if config_path.exists():
+        contents = config_path.read_text()
+    else:
+        contents = ""
+    return contents, parse_tags_from_toml(contents)
+
+
+def write_config(config_path: Path, contents: str, tags: list[str]) -> bool:
+    updated = write_tags_into_toml(contents, tags)
+    if updated == contents:
+        return False
+    if not _reads_back(contents, updated, tags):
+        print(f"Skipping {config_path}: tags would not read back.", file=sys.stderr)
+        return False
+    _atomic_write(config_path, updated)
+    return True
+
+
+def _reads_back(contents: str, updated: str, tags: list[str]) -> bool:
+    if parse_tags_from_toml(updated) != tags:
+        return False
+    before = _load_toml(contents)
+    if before is None:
+        # Not TOML to begin with (or no tomllib); navgator's reader is all there is.
+        return True
+    # navgator and a TOML reader must agree on the tags, before and after.
+    if before.get("tags", []) != parse_tags_from_toml(contents):
+        return False
+    after = _load_toml(updated)
+    return after is not None and after.get("tags") == tags
+
+
+def _load_toml(contents: str) -> dict | None:
+    if tomllib is None:
+        return None
+    try:
+        return tomllib.loads(contents)
+    except tomllib.TOMLDecodeError:
+        return None
+
+
+def _atomic_write(path: Path, text: str) -> None:
+    # Write through a symlinked file (e.g. a dotfiles-managed link) to its target.
+    path = Path(os.path.realpath(path))
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f"{path.name}.", suffix=".tmp"
+    )
+    tmp = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "w") as handle:
+            handle.write(text)
+            # Flush to disk before the rename so a power loss can't leave an
+            # empty file in place of the config.
+            handle.flush()
+            os.fsync(handle.fileno())
+        if path.exists():
+            shutil.copymode(path, tmp)
+        else:
+            # mkstemp creates 0600; give new files the mode open() would.
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp, 0o666 & ~umask)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def parse_tags_from_toml(contents: str) -> list[str]:
+    # Mirrors navgator's own reader (navgator-navigate/src/tags.rs): the raw text
+    # between double quotes, with no escape handling.
+    in_tags = False
+    buffer = []
+    for line in contents.splitlines():
+        cleaned = line.split("#", 1)[0].strip()
+        if not cleaned:
+            continue
+        if not in_tags:
+            if "=" not in cleaned:
+                continue
+            key, value = cleaned.split("=", 1)
+            if key.strip() not in {"tags", '"tags"', "'tags'"}:
+                continue
+            value = value.strip()
+            buffer.append(value)
+            if "[" in value:
+                in_tags = True
+            if "]" in value:
+                break
+        else:
+            buffer.append(cleaned)
+            if "]" in cleaned:
+                break
+
+    if not buffer:
+        return []
+    return extract_quoted_strings(" ".join(buffer))
+
+
+def extract_quoted_strings(text: str) -> list[str]:
+    tags = []
+    for match in _QUOTED_STRING.finditer(text):
+        tag = match.group(1)
+        if tag:
+            tags.append(tag)
+    return tags
+
+
+def write_tags_into_toml(contents: str, tags: list[str]) -> str:
+    line = f"tags = [{', '.join(format_tag(tag) for tag in tags)}]"
+    if not contents.strip():
+        return line + "\n"
+
+    out = io.StringIO()
+    found = False
+    in_tags = False
+    skipped: list[str] = []
+    for raw in contents.splitlines():
+        if in_tags:
+            skipped.append(raw)
+            if "]" in _toml_code(raw):
+                in_tags = False
+            continue
+        if not found and (match := _TAGS_KEY.match(raw)):
+            found = True
+            out.write(line + "\n")
+            value = _toml_code(raw[match.end() :])
+            in_tags = value.lstrip().startswith("[") and "]" not in value
+            continue
+        out.write(raw + "\n")
+
+    if not found:
+        lines = contents.rstrip().splitlines()
+        for i, raw in enumerate(lines):
+            if _TABLE_HEADER.match(raw):
+                # Keep the new key top-level rather than inside the first table.
+                return "\n".join(lines[:i] + [line] + lines[i:]) + "\n"
+        return contents.rstrip() + "\n" + line + "\n"
+    if in_tags:
+        # An unterminated array only replaces its first line, as before.
+        for raw in skipped:
+            out.write(raw + "\n")
+    return out.getvalue()
+
+
+def _toml_code(text: str) -> str:
+    return _TOML_STRING.sub('""', text).split("#", 1)[0]
+
+
+def format_tag(tag: str) -> str:
+    # Same on-disk form navgator writes; backslashes stay raw.
+    return '"' + tag.replace('"', '\\"') + '"'
+
+
+def slugify(value: str) -> str:
+    value = value.strip().lower().translate(_SLUG_SEPARATORS)
+    value = _SLUG_DROP.sub("", value)
+    return _SLUG_DASHES.sub("-", value).strip("-")
@@ -0,0 +1,282 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+import _navgator_tags as tags_mod
+from _navgator_tags import (
+    GhClient,
+    git_common_dir,
+    git_root,
+    github_repo,
+    load_gh_cache,
+    origin_url,
+    parse_tags_from_toml,
+    read_config,
+    slugify,
+    write_config,
+    write_tags_into_toml,
+)
+
+
+class TempDirTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(os.path.realpath(self._tmp.name))
+        tags_mod._git_root.cache_clear()
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+
+class ParseTagsTests(unittest.TestCase):
+    def test_reads_single_and_multi_line_arrays(self) -> None:
+        self.assertEqual(parse_tags_from_toml('tags = ["a", "b"] # c\n'), ["a", "b"])
+        self.assertEqual(
+            parse_tags_from_toml('name = "x"\ntags = [\n  "a", # c\n  "b",\n]\n'),
+            ["a", "b"],
+        )
+
+    def test_backslashes_stay_raw_like_navgator(self) -> None:
+        self.assertEqual(parse_tags_from_toml('tags = ["dev\\x"]\n'), ["dev\\x"])
+        self.assertEqual(parse_tags_from_toml('tags = ["C:\\\\tmp"]\n'), ["C:\\\\tmp"])
+
+    def test_quoted_key(self) -> None:
+        self.assertEqual(parse_tags_from_toml('"tags" = ["a"]\n'), ["a"])
+
+    def test_no_tags(self) -> None:
+        self.assertEqual(parse_tags_from_toml(""), [])
+        self.assertEqual(parse_tags_from_toml('name = "x"\n'), [])
+
+
+class WriteTagsTests(unittest.TestCase):
+    def assertRoundTrip(self, contents: str, expected: str) -> None:
+        tags = parse_tags_from_toml(contents) + ["lang/x"]
+        updated = write_tags_into_toml(contents, tags)
+        self.assertEqual(updated, expected)
+        self.assertEqual(parse_tags_from_toml(updated), tags)
+
+    def test_empty_file(self) -> None:
+        self.assertRoundTrip("", 'tags = ["lang/x"]\n')
+
+    def test_replaces_single_line_in_place(self) -> None:
+        self.assertRoundTrip(
+            'name = "x"\ntags = ["a"] # c\nz = 1\n',
+            'name = "x"\ntags = ["a", "lang/x"]\nz = 1\n',
+        )
+
+    def test_replaces_multi_line_array(self) -> None:
+        self.assertRoundTrip(
+            'tags = [\n  "a",\n  "b",\n]\nz = 1\n',
+            'tags = ["a", "b", "lang/x"]\nz = 1\n',
+        )
+
+    def test_brackets_inside_strings_do_not_end_the_array(self) -> None:
+        for contents in [
+            'tags = [\n  "]a",\n  "b#",\n]\nz = 1\n',
+            "tags = [\n  'a]b',\n  \"c\",\n]\nz = 1\n",
+        ]:
+            with self.subTest(contents=contents):
+                self.assertEqual(
+                    write_tags_into_toml(contents, ["q"]), 'tags = ["q"]\nz = 1\n'
+                )
+
+    def test_appends_before_first_table(self) -> None:
+        self.assertRoundTrip(
+            'name = "x"\n[paths]\nindex_folders = []\n',
+            'name = "x"\ntags = ["lang/x"]\n[paths]\nindex_folders = []\n',
+        )
+
+    def test_non_array_value_replaces_only_its_line(self) -> None:
+        self.assertEqual(
+            write_tags_into_toml('tags = "x"\n[sec]\nk = 1\n', ["a"]),
+            'tags = ["a"]\n[sec]\nk = 1\n',
+        )
+
+    def test_unterminated_array_keeps_following_lines(self) -> None:
+        self.assertEqual(
+            write_tags_into_toml('a = 1\ntags = ["a",\n"b"\n', ["q"]),
+            'a = 1\ntags = ["q"]\n"b"\n',
+        )
+
+
+class WriteConfigTests(TempDirTestCase):
+    def write(self, contents: str, added: list[str]) -> tuple[bool, str]:
+        path = self.root / ".navgator.toml"
+        path.write_text(contents)
+        current, tags = read_config(path)
+        with contextlib.redirect_stderr(io.StringIO()):
+            changed = write_config(path, current, tags + added)
+        return changed, path.read_text()
+
+    def test_navgator_written_backslash_is_kept(self) -> None:
+        self.assertEqual(
+            self.write('tags = ["dev\\x"]\n', ["lang/x"]),
+            (True, 'tags = ["dev\\x", "lang/x"]\n'),
+        )
+
+    def test_quoted_key_is_replaced_not_duplicated(self) -> None:
+        self.assertEqual(
+            self.write('"tags" = ["a"]\n', ["lang/x"]),
+            (True, 'tags = ["a", "lang/x"]\n'),
+        )
+
+    def test_skips_files_navgator_and_toml_read_differently(self) -> None:
+        for contents in [
+            'tags = ["C:\\\\tmp"]\n',
+            "tags = ['lit', \"b\"]\n",
+            # navgator's reader stops at '#' and ']', even inside quotes.
+            'tags = [\n  "a",\n  "b#c",\n]\n',
+            'tags = [\n  "]a",\n  "b",\n]\n',
+            '[p]\ntags = ["z"]\n',
+            # A nested array line looks like a table header to the splice.
+            "x = [\n  [1, 2],\n]\n",
+        ]:
+            with self.subTest(contents=contents):
+                self.assertEqual(self.write(contents, ["lang/x"]), (False, contents))
+
+    def test_unchanged_file_is_not_written(self) -> None:
+        self.assertEqual(self.write('tags = ["a"]\n', []), (False, 'tags = ["a"]\n'))
+
+    def test_symlinked_config_stays_a_link(self) -> None:
+        target = self.root / "real.toml"
+        target.write_text('tags = ["a"]\n')
+        link = self.root / ".navgator.toml"
+        link.symlink_to(target)
+        contents, tags = read_config(link)
+        self.assertTrue(write_config(link, contents, tags + ["lang/x"]))
+        self.assertTrue(link.is_symlink())
+        self.assertEqual(target.read_text(), 'tags = ["a", "lang/x"]\n')
+        names = sorted(p.name for p in self.root.iterdir())
+        self.assertEqual(names, [".navgator.toml", "real.toml"])
+
+
+class GitDiscoveryTests(TempDirTestCase):
+    def make_repo(self, name: str, url: str) -> Path:
+        repo = self.root / name
+        (repo / ".git").mkdir(parents=True)
+        (repo / ".git" / "config").write_text(
+            "[core]\n\tbare = false\n"
+            '[remote "upstream"]\n\turl = https://github.com/x/y\n'
+            f'[remote "origin"]\n\turl = {url}\n\tfetch = +refs/heads/*\n'
+        )
+        return repo
+
+    def test_finds_root_from_subdirectory(self) -> None:
+        repo = self.make_repo("repo", "git@github.com:me/repo.git")
+        nested = repo / "a" / "b"
+        nested.mkdir(parents=True)
+        self.assertEqual(git_root(nested), repo)
+        self.assertIsNone(git_root(self.root))
+
+    def test_worktree_gitfile_uses_common_config(self) -> None:
+        repo = self.make_repo("repo", "git@github.com:me/repo.git")
+        gitdir = repo / ".git" / "worktrees" / "wt"
+        gitdir.mkdir(parents=True)
+        (gitdir / "commondir").write_text("../..\n")
+        worktree = self.root / "wt"
+        worktree.mkdir()
+        (worktree / ".git").write_text(f"gitdir: {gitdir}\n")
+        self.assertEqual(git_root(worktree), worktree)
+        self.assertEqual(git_common_dir(worktree).resolve(), repo / ".git")
+        self.assertEqual(origin_url(worktree), "git@github.com:me/repo.git")
+
+    def test_relative_submodule_gitfile(self) -> None:
+        repo = self.make_repo("repo", "https://github.com/me/repo")
+        modules = repo / ".git" / "modules" / "sub"
+        modules.mkdir(parents=True)
+        (modules / "config").write_text(
+            '[remote "origin"]\n\turl = https://github.com/me/sub\n'
+        )
+        sub = repo / "sub"
+        sub.mkdir()
+        (sub / ".git").write_text("gitdir: ../.git/modules/sub\n")
+        self.assertEqual(git_root(sub), sub)
+        self.assertEqual(origin_url(sub), "https://github.com/me/sub")
+
+    def test_broken_gitfile_stops_the_walk(self) -> None:
+        self.make_repo("repo", "https://github.com/me/repo")
+        broken = self.root / "repo" / "broken"
+        broken.mkdir()
+        (broken / ".git").write_text("gitdir: /nonexistent\n")
+        self.assertIsNone(git_root(broken))
+
+
+class GithubRepoTests(unittest.TestCase):
+    def test_remote_forms(self) -> None:
+        cases = {
+            "git@github.com:me/repo.git": ("me", "repo"),
+            "https://github.com/me/repo": ("me", "repo"),
+            "https://github.com/me/repo.git/": ("me", "repo"),
+            "ssh://git@github.com/me/repo.git": ("me", "repo"),
+            "https://GitHub.com/me/repo": ("me", "repo"),
+            "https://gitlab.com/me/repo": None,
+            "https://github.com/me/repo/extra": None,
+            "/local/path/repo": None,
+            None: None,
+        }
+        for url, expected in cases.items():
+            with self.subTest(url=url):
+                self.assertEqual(github_repo(url), expected)
+
+
+class GhCacheTests(TempDirTestCase):
+    fields = "isInOrganization url"
+
+    def test_malformed_entries_are_dropped(self) -> None:
+        path = self.root / "gh_meta.json"
+        good = {"fields": self.fields, "info": None, "fetched": 1.0}
+        path.write_text(
+            json.dumps(
+                {
+                    "me/good": good,
+                    "me/text": {**good, "fetched": "yesterday"},
+                    "me/bool": {**good, "fetched": True},
+                    "me/info": {**good, "info": []},
+                    "me/none": 1,
+                }
+            )
+        )
+        self.assertEqual(load_gh_cache(path), {"me/good": good})
+        path.write_text("not json")
+        self.assertEqual(load_gh_cache(path), {})
+
+    def test_fresh_entries_skip_the_network(self) -> None:
+        path = self.root / "gh_meta.json"
+        info = {"isInOrganization": True, "url": "https://github.com/acme/a"}
+        fresh = {"fields": self.fields, "info": info, "fetched": time.time()}
+        stale = {"fields": self.fields, "info": None, "fetched": 0}
+        path.write_text(json.dumps({"acme/a": fresh, "acme/b": stale}))
+        queries: list[str] = []
+        client = GhClient(self.fields, path)
+        client.graphql = lambda query: queries.append(query) or {"r0": info}
+        client.fetch([("acme", "a"), ("acme", "b")])
+        self.assertEqual(len(queries), 1)
+        self.assertIn('name: "b"', queries[0])
+        self.assertNotIn('name: "a"', queries[0])
+        self.assertEqual(client.repos[("acme", "b")], info)
+        client.save_cache()
+        self.assertEqual(json.loads(path.read_text())["acme/b"]["info"], info)
+
+
+class SlugifyTests(unittest.TestCase):
+    def test_language_names(self) -> None:
+        cases = {
+            "Python": "python",
+            "Jupyter Notebook": "jupyter-notebook",
+            "C++": "c",
+            "Objective-C": "objective-c",
+            "  A _ . - b !": "a-b",
+            "Ren'Py": "renpy",
+        }
+        for value, expected in cases.items():
+            with self.subTest(value=value):
+                self.assertEqual(slugify(value), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
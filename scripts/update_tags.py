@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+from pathlib import Path
+from urllib.parse import urlparse
+
+from _navgator_tags import (
+    GhClient,
+    build_items,
+    gh_cache_path,
+    git_root,
+    read_config,
+    slugify,
+    unique_paths,
+    write_config,
+)
+
+KINDS = ("lang", "org")
+REPO_FIELDS = "primaryLanguage { name } isInOrganization url"
+
+
+def main(kinds: tuple[str, ...] = KINDS) -> int:
+    home = Path.home()
+    # Scan roots overlap (e.g. ~/Desktop is both static and indexed).
+    items = unique_paths(build_items(home))
+    resolved = (resolve_root(path) for path in items)
+    roots = list(dict.fromkeys(root for root in resolved if root is not None))
+    scanned = len(roots)
+
+    client = GhClient(REPO_FIELDS, gh_cache_path())
+    try:
+        infos = client.repo_info(roots)
+    finally:
+        client.close()
+    client.save_cache()
+
+    updated = 0
+    for repo_root in roots:
+        info = infos.get(repo_root)
+        if info is None:
+            continue
+        lang = language_tag(info) if "lang" in kinds else None
+        org = org_tag(info) if "org" in kinds else None
+        if update_repo_tags(repo_root, lang, org):
+            updated += 1
+
+    print(f"Scanned {scanned} repos, updated {updated} files.")
+    return 0
+
+
+def resolve_root(path: Path) -> Path | None:
+    if not path.is_dir():
+        return None
+    return git_root(path)
+
+
+def language_tag(info: dict) -> str | None:
+    lang = info.get("primaryLanguage")
+    if not isinstance(lang, dict):
+        return None
+    name = lang.get("name")
+    if not isinstance(name, str) or not name.strip():
+        return None
+    return f"lang/{slugify(name.strip())}"
+
+
+def org_tag(info: dict) -> str | None:
+    if not info.get("isInOrganization"):
+        return None
+    org = org_from_url(info.get("url"))
+    if not org:
+        return None
+    return f"org/{org}"
+
+
+def org_from_url(url: str | None) -> str | None:
+    if not url:
+        return None
+    parsed = urlparse(url)
+    parts = [part for part in parsed.path.split("/") if part]
+    if len(parts) < 2:
+        return None
+    return parts[0]
+
+
+def update_repo_tags(repo_root: Path, lang: str | None, org: str | None) -> bool:
+    if lang is None and org is None:
+        return False
+    config_path = repo_root / ".navgator.toml"
+    contents, current = read_config(config_path)
+
+    tags = list(current)
+    if lang is not None:
+        # A repo has one primary language; drop any stale lang/ tag.
+        tags = [t for t in tags if not t.startswith("lang/") or t == lang]
+        if lang not in tags:
+            tags.append(lang)
+    if org is not None and org not in tags:
+        tags.append(org)
+    if tags == current:
+        return False
+
+    return write_config(config_path, contents, tags)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())